@@ -432,7 +432,9 @@ resource "aws_lambda_function" "resource_optimizer" {
   function_name    = "${var.environment}-resource-optimizer"
   role            = aws_iam_role.lambda_optimizer[0].arn
   handler         = "index.handler"
-  runtime         = "python3.9"
+  runtime         = "python3.12"  # SnapStart for Python requires 3.12+
+  memory_size     = var.resource_optimizer_memory_size
+  publish         = true
   timeout         = 300
 
   environment {
@@ -442,6 +444,12 @@ resource "aws_lambda_function" "resource_optimizer" {
     }
   }
 
+  # Restore the initialized module (imports and boto3 clients) from a
+  # snapshot instead of re-running it on cold start
+  snap_start {
+    apply_on = "PublishedVersions"
+  }
+
   tags = var.common_tags
 }
 
@@ -488,6 +496,7 @@ resource "aws_iam_role_policy" "lambda_optimizer" {
           "rds:DescribeDBInstances",
           "rds:StopDBInstance",
           "cloudwatch:GetMetricStatistics",
+          "cloudwatch:GetMetricData",
           "ce:GetUsageAndCosts",
           "ce:GetReservationCoverage",
           "ce:GetReservationPurchaseRecommendation"
@@ -514,7 +523,7 @@ resource "aws_cloudwatch_event_target" "lambda" {
   
   rule      = aws_cloudwatch_event_rule.resource_optimization[0].name
   target_id = "ResourceOptimizerTarget"
-  arn       = aws_lambda_function.resource_optimizer[0].arn
+  arn       = aws_lambda_function.resource_optimizer[0].qualified_arn
 }
 
 resource "aws_lambda_permission" "allow_cloudwatch" {
@@ -523,6 +532,7 @@ resource "aws_lambda_permission" "allow_cloudwatch" {
   statement_id  = "AllowExecutionFromCloudWatch"
   action        = "lambda:InvokeFunction"
   function_name = aws_lambda_function.resource_optimizer[0].function_name
+  qualifier     = aws_lambda_function.resource_optimizer[0].version
   principal     = "events.amazonaws.com"
   source_arn    = aws_cloudwatch_event_rule.resource_optimization[0].arn
 }
@@ -4,74 +4,307 @@ AWS Resource Optimizer Lambda Function
 Automatically optimizes AWS resources for cost efficiency
 """
 
-import js
+import os
+import re
 import json
+import time
 import boto3
 import logging
+import threading
+import jmespath
+import functools
+from statistics import fmean
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# GetMetricData accepts at most 500 queries per request
+METRIC_DATA_BATCH_SIZE = 500
+
+# GetMetricData batches are fetched concurrently by up to this many threads
+METRIC_DATA_MAX_WORKERS = 16
+
+# Only the window-wide average is used, so daily datapoints are enough and
+# return 24x fewer values than hourly ones
+METRIC_PERIOD_SECONDS = 86400  # 1 day
+
+# Rough hourly on-demand prices keyed on the instance size token
+# (e.g. 't3.micro', 'db.t3.small'); 'large' also covers the xlarge sizes
+DEFAULT_HOURLY_COST = 0.10
+HOURS_PER_MONTH = 24 * 30
+EC2_HOURLY_COSTS = {
+    'micro': 0.0116,
+    'small': 0.0232,
+    'medium': 0.0464,
+    'large': 0.0928
+}
+RDS_HOURLY_COSTS = {
+    'micro': 0.017,
+    'small': 0.034,
+    'medium': 0.068
+}
+_SIZE_PATTERN = re.compile(r'micro|small|medium|large')
+
+@functools.lru_cache(maxsize=None)
+def _size_token(instance_type: str) -> Optional[str]:
+    """Extract the size token from an instance type/class (memoized; fleets reuse few types)"""
+    match = _SIZE_PATTERN.search(instance_type)
+    return match.group(0) if match else None
+
+def estimate_hourly_cost(instance_type: str, price_table: Dict[str, float]) -> float:
+    """Look up the hourly cost for an instance type/class, falling back to the default estimate"""
+    return price_table.get(_size_token(instance_type), DEFAULT_HOURLY_COST)
+
+# Idle thresholds on the window-wide metric average
+EC2_IDLE_CPU_PERCENT = 5.0  # Less than 5% CPU utilization
+RDS_IDLE_CONNECTIONS = 1.0  # Less than 1 average connection
+
+# Resources seen at or above their idle threshold are remembered per container
+# so warm invocations can skip their metric queries until the entry expires
+ACTIVE_RESOURCE_TTL_SECONDS = 6 * 3600
+_active_resources: Dict[Tuple[str, str], float] = {}
+
+# Shared client configuration: a connection pool large enough for the EC2 and
+# RDS metric batches running side by side, and adaptive retries to back off
+# on throttling
+BOTO_CONFIG = Config(
+    max_pool_connections=2 * METRIC_DATA_MAX_WORKERS,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Clients are built once per container so warm invocations reuse them.
+# Creation can fail outside Lambda (e.g. no region configured), in which
+# case ResourceOptimizer builds its own clients on instantiation.
+try:
+    _EC2 = boto3.client('ec2', config=BOTO_CONFIG)
+    _RDS = boto3.client('rds', config=BOTO_CONFIG)
+    _CW = boto3.client('cloudwatch', config=BOTO_CONFIG)
+    _CE = boto3.client('ce', config=BOTO_CONFIG)
+    _SNS = boto3.client('sns', config=BOTO_CONFIG)
+except Exception as e:
+    logger.warning(f"Deferring boto3 client creation: {e}")
+    _EC2 = _RDS = _CW = _CE = _SNS = None
+
+# Instance inventories are cached per container for a short TTL so warm
+# invocations skip the describe round trip
+DESCRIBE_CACHE_TTL_SECONDS = 60
+
+# Kept identical to ttl_cache in ../cross-cloud/dr_orchestrator.py; each Lambda is packaged
+# from its own directory, so the two cannot share a module
+def ttl_cache(ttl: float):
+    """Memoize a function per argument tuple, expiring entries after ttl seconds"""
+    def decorator(func):
+        cache: Dict[Any, Tuple[float, Any]] = {}
+        # One lock per argument tuple, held across the call so concurrent
+        # callers share one fetch without serializing calls for other keys
+        key_locks: Dict[Any, threading.Lock] = {}
+        key_locks_lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            with key_locks_lock:
+                key_lock = key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                now = time.monotonic()
+                entry = cache.get(key)
+                if entry is not None and now - entry[0] < ttl:
+                    return entry[1]
+                
+                result = func(*args, **kwargs)
+                cache[key] = (now, result)
+                return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+# Flatten describe responses down to the fields this module reads, so cached
+# inventories hold small records instead of full API payloads
+_INSTANCE_FIELDS = jmespath.compile(
+    'Reservations[].Instances[].{InstanceId: InstanceId, InstanceType: InstanceType, '
+    'LaunchTime: LaunchTime, Tags: Tags}'
+)
+_DB_INSTANCE_FIELDS = jmespath.compile(
+    'DBInstances[].{DBInstanceIdentifier: DBInstanceIdentifier, DBInstanceStatus: DBInstanceStatus, '
+    'DBInstanceClass: DBInstanceClass, Engine: Engine, InstanceCreateTime: InstanceCreateTime}'
+)
+
+@ttl_cache(ttl=DESCRIBE_CACHE_TTL_SECONDS)
+def _describe_running_instances(ec2_client, environment: str) -> List[Dict[str, Any]]:
+    """List running EC2 instances tagged with the given environment"""
+    response = ec2_client.describe_instances(
+        Filters=[
+            {'Name': 'instance-state-name', 'Values': ['running']},
+            {'Name': 'tag:Environment', 'Values': [environment]}
+        ]
+    )
+    
+    return _INSTANCE_FIELDS.search(response) or []
+
+@ttl_cache(ttl=DESCRIBE_CACHE_TTL_SECONDS)
+def _describe_db_instances(rds_client) -> List[Dict[str, Any]]:
+    """List all RDS instances"""
+    return _DB_INSTANCE_FIELDS.search(rds_client.describe_db_instances()) or []
+
+# Cost Explorer recommendations are refreshed daily by AWS and billed per
+# request, so warm containers reuse them for an hour
+COST_RECOMMENDATIONS_TTL_SECONDS = 3600
+
+@ttl_cache(ttl=COST_RECOMMENDATIONS_TTL_SECONDS)
+def _fetch_cost_recommendations(ce_client) -> Dict[str, Any]:
+    """Fetch Reserved Instance and Savings Plans purchase recommendations"""
+    # Get Reserved Instance recommendations
+    ri_recommendations = ce_client.get_reservation_purchase_recommendation(
+        Service='Amazon Elastic Compute Cloud - Compute',
+        PaymentOption='PARTIAL_UPFRONT',
+        TermInYears='ONE_YEAR'
+    )
+    
+    # Get Savings Plans recommendations
+    sp_recommendations = ce_client.get_savings_plans_purchase_recommendation(
+        SavingsPlansType='COMPUTE_SP',
+        TermInYears='ONE_YEAR',
+        PaymentOption='PARTIAL_UPFRONT'
+    )
+    
+    return {
+        'reserved_instances': ri_recommendations.get('Recommendations', []),
+        'savings_plans': sp_recommendations.get('Recommendations', [])
+    }
+
 class ResourceOptimizer:
     """Main class for resource optimization"""
     
     def __init__(self):
-        self.ec2 = boto3.client('ec2')
-        self.rds = boto3.client('rds')
-        self.cloudwatch = boto3.client('cloudwatch')
-        self.ce = boto3.client('ce')
-        self.sns = boto3.client('sns')
+        self.ec2 = _EC2 or boto3.client('ec2', config=BOTO_CONFIG)
+        self.rds = _RDS or boto3.client('rds', config=BOTO_CONFIG)
+        self.cloudwatch = _CW or boto3.client('cloudwatch', config=BOTO_CONFIG)
+        self.ce = _CE or boto3.client('ce', config=BOTO_CONFIG)
+        self.sns = _SNS or boto3.client('sns', config=BOTO_CONFIG)
         
         self.environment = os.environ.get('ENVIRONMENT', 'dev')
         self.idle_threshold_days = int(os.environ.get('IDLE_THRESHOLD_DAYS', '7'))
         
+    def _fetch_metric_batch(self, queries: List[Dict[str, Any]], start_time: datetime,
+                            end_time: datetime) -> Dict[str, List[float]]:
+        """Run one GetMetricData batch, following NextToken, and collect values per query Id"""
+        values_by_id = {}
+        request = {
+            'MetricDataQueries': queries,
+            'StartTime': start_time,
+            'EndTime': end_time,
+            'ScanBy': 'TimestampDescending'
+        }
+        
+        while True:
+            response = self.cloudwatch.get_metric_data(**request)
+            for result in response['MetricDataResults']:
+                values_by_id.setdefault(result['Id'], []).extend(result['Values'])
+            
+            next_token = response.get('NextToken')
+            if not next_token:
+                return values_by_id
+            request['NextToken'] = next_token
+    
+    def _get_metric_averages(self, namespace: str, metric_name: str, dimension_name: str,
+                             resource_ids: List[str], idle_threshold: float) -> Dict[str, float]:
+        """Fetch metric averages for many resources with batched GetMetricData calls
+        
+        Resources recently seen at or above idle_threshold are skipped and left
+        out of the result.
+        """
+        # Metrics Insights (SELECT AVG(...) GROUP BY ...) would collapse this to a
+        # single query, but it only covers the most recent three hours of data,
+        # which is far shorter than the idle threshold window. Explicit MetricStat
+        # queries keep the full window at ceil(N / 500) requests.
+        averages = {}
+        now = time.monotonic()
+        resource_ids = [
+            resource_id for resource_id in resource_ids
+            if now - _active_resources.get((namespace, resource_id), float('-inf')) >= ACTIVE_RESOURCE_TTL_SECONDS
+        ]
+        if not resource_ids:
+            return averages
+        
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(days=self.idle_threshold_days)
+        
+        queries = [
+            {
+                'Id': f"m{index}",
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': namespace,
+                        'MetricName': metric_name,
+                        'Dimensions': [
+                            {'Name': dimension_name, 'Value': resource_id}
+                        ]
+                    },
+                    'Period': METRIC_PERIOD_SECONDS,
+                    'Stat': 'Average'
+                },
+                'ReturnData': True
+            }
+            for index, resource_id in enumerate(resource_ids)
+        ]
+        
+        batches = [
+            queries[offset:offset + METRIC_DATA_BATCH_SIZE]
+            for offset in range(0, len(queries), METRIC_DATA_BATCH_SIZE)
+        ]
+        fetch_batch = functools.partial(
+            self._fetch_metric_batch, start_time=start_time, end_time=end_time
+        )
+        
+        values_by_id = {}
+        with ThreadPoolExecutor(max_workers=min(METRIC_DATA_MAX_WORKERS, len(batches))) as executor:
+            for batch_values in executor.map(fetch_batch, batches):
+                values_by_id.update(batch_values)
+        
+        for index, resource_id in enumerate(resource_ids):
+            values = values_by_id.get(f"m{index}")
+            if values:
+                averages[resource_id] = fmean(values)
+                if averages[resource_id] >= idle_threshold:
+                    _active_resources[(namespace, resource_id)] = now
+        
+        return averages
+        
     def get_idle_ec2_instances(self) -> List[Dict[str, Any]]:
         """Identify idle EC2 instances"""
         idle_instances = []
         
         try:
             # Get all running instances
-            response = self.ec2.describe_instances(
-                Filters=[
-                    {'Name': 'instance-state-name', 'Values': ['running']},
-                    {'Name': 'tag:Environment', 'Values': [self.environment]}
-                ]
+            instances = _describe_running_instances(self.ec2, self.environment)
+            
+            # Check CPU utilization over the past week for all instances at once
+            cpu_averages = self._get_metric_averages(
+                namespace='AWS/EC2',
+                metric_name='CPUUtilization',
+                dimension_name='InstanceId',
+                resource_ids=[instance['InstanceId'] for instance in instances],
+                idle_threshold=EC2_IDLE_CPU_PERCENT
             )
             
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_id = instance['InstanceId']
-                    
-                    # Check CPU utilization over the past week
-                    end_time = datetime.utcnow()
-                    start_time = end_time - timedelta(days=self.idle_threshold_days)
-                    
-                    cpu_metrics = self.cloudwatch.get_metric_statistics(
-                        Namespace='AWS/EC2',
-                        MetricName='CPUUtilization',
-                        Dimensions=[
-                            {'Name': 'InstanceId', 'Value': instance_id}
-                        ],
-                        StartTime=start_time,
-                        EndTime=end_time,
-                        Period=3600,  # 1 hour
-                        Statistics=['Average']
-                    )
-                    
-                    if cpu_metrics['Datapoints']:
-                        avg_cpu = sum(dp['Average'] for dp in cpu_metrics['Datapoints']) / len(cpu_metrics['Datapoints'])
-                        
-                        if avg_cpu < 5.0:  # Less than 5% CPU utilization
-                            idle_instances.append({
-                                'InstanceId': instance_id,
-                                'InstanceType': instance['InstanceType'],
-                                'LaunchTime': instance['LaunchTime'].isoformat(),
-                                'AvgCPU': avg_cpu,
-                                'Tags': instance.get('Tags', [])
-                            })
+            for instance in instances:
+                instance_id = instance['InstanceId']
+                avg_cpu = cpu_averages.get(instance_id)
+                
+                if avg_cpu is not None and avg_cpu < EC2_IDLE_CPU_PERCENT:
+                    idle_instances.append({
+                        'InstanceId': instance_id,
+                        'InstanceType': instance['InstanceType'],
+                        'LaunchTime': instance['LaunchTime'].isoformat(),
+                        'AvgCPU': avg_cpu,
+                        'Tags': instance['Tags'] or []
+                    })
             
             logger.info(f"Found {len(idle_instances)} idle EC2 instances")
             return idle_instances
@@ -85,41 +318,32 @@ class ResourceOptimizer:
         idle_instances = []
         
         try:
-            response = self.rds.describe_db_instances()
+            db_instances = [
+                db_instance for db_instance in _describe_db_instances(self.rds)
+                if db_instance['DBInstanceStatus'] == 'available'
+            ]
             
-            for db_instance in response['DBInstances']:
-                if db_instance['DBInstanceStatus'] != 'available':
-                    continue
-                
+            # Check database connections over the past week for all instances at once
+            connection_averages = self._get_metric_averages(
+                namespace='AWS/RDS',
+                metric_name='DatabaseConnections',
+                dimension_name='DBInstanceIdentifier',
+                resource_ids=[db_instance['DBInstanceIdentifier'] for db_instance in db_instances],
+                idle_threshold=RDS_IDLE_CONNECTIONS
+            )
+            
+            for db_instance in db_instances:
                 db_instance_id = db_instance['DBInstanceIdentifier']
+                avg_connections = connection_averages.get(db_instance_id)
                 
-                # Check database connections over the past week
-                end_time = datetime.utcnow()
-                start_time = end_time - timedelta(days=self.idle_threshold_days)
-                
-                connection_metrics = self.cloudwatch.get_metric_statistics(
-                    Namespace='AWS/RDS',
-                    MetricName='DatabaseConnections',
-                    Dimensions=[
-                        {'Name': 'DBInstanceIdentifier', 'Value': db_instance_id}
-                    ],
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=3600,  # 1 hour
-                    Statistics=['Average']
-                )
-                
-                if connection_metrics['Datapoints']:
-                    avg_connections = sum(dp['Average'] for dp in connection_metrics['Datapoints']) / len(connection_metrics['Datapoints'])
-                    
-                    if avg_connections < 1.0:  # Less than 1 average connection
-                        idle_instances.append({
-                            'DBInstanceIdentifier': db_instance_id,
-                            'DBInstanceClass': db_instance['DBInstanceClass'],
-                            'Engine': db_instance['Engine'],
-                            'AvgConnections': avg_connections,
-                            'InstanceCreateTime': db_instance['InstanceCreateTime'].isoformat()
-                        })
+                if avg_connections is not None and avg_connections < RDS_IDLE_CONNECTIONS:
+                    idle_instances.append({
+                        'DBInstanceIdentifier': db_instance_id,
+                        'DBInstanceClass': db_instance['DBInstanceClass'],
+                        'Engine': db_instance['Engine'],
+                        'AvgConnections': avg_connections,
+                        'InstanceCreateTime': db_instance['InstanceCreateTime'].isoformat()
+                    })
             
             logger.info(f"Found {len(idle_instances)} idle RDS instances")
             return idle_instances
@@ -131,25 +355,7 @@ class ResourceOptimizer:
     def get_cost_recommendations(self) -> Dict[str, Any]:
         """Get cost optimization recommendations"""
         try:
-            # Get Reserved Instance recommendations
-            ri_recommendations = self.ce.get_reservation_purchase_recommendation(
-                Service='Amazon Elastic Compute Cloud - Compute',
-                PaymentOption='PARTIAL_UPFRONT',
-                TermInYears='ONE_YEAR'
-            )
-            
-            # Get Savings Plans recommendations
-            sp_recommendations = self.ce.get_savings_plans_purchase_recommendation(
-                SavingsPlansType='COMPUTE_SP',
-                TermInYears='ONE_YEAR',
-                PaymentOption='PARTIAL_UPFRONT'
-            )
-            
-            return {
-                'reserved_instances': ri_recommendations.get('Recommendations', []),
-                'savings_plans': sp_recommendations.get('Recommendations', [])
-            }
-            
+            return _fetch_cost_recommendations(self.ce)
         except Exception as e:
             logger.error(f"Error getting cost recommendations: {e}")
             return {}
@@ -158,38 +364,16 @@ class ResourceOptimizer:
                                    cost_recommendations: Dict) -> Dict[str, Any]:
         """Generate optimization report"""
         
-        # Calculate potential savings
-        ec2_savings = 0
-        for instance in idle_ec2:
-            # Rough estimate: $0.10 per hour for t3.medium
-            instance_type = instance['InstanceType']
-            if 'micro' in instance_type:
-                hourly_cost = 0.0116
-            elif 'small' in instance_type:
-                hourly_cost = 0.0232
-            elif 'medium' in instance_type:
-                hourly_cost = 0.0464
-            elif 'large' in instance_type:
-                hourly_cost = 0.0928
-            else:
-                hourly_cost = 0.10  # Default estimate
-            
-            ec2_savings += hourly_cost * 24 * 30  # Monthly savings
+        # Calculate potential monthly savings
+        ec2_savings = sum(
+            estimate_hourly_cost(instance['InstanceType'], EC2_HOURLY_COSTS)
+            for instance in idle_ec2
+        ) * HOURS_PER_MONTH
         
-        rds_savings = 0
-        for instance in idle_rds:
-            # Rough estimate based on instance class
-            instance_class = instance['DBInstanceClass']
-            if 'micro' in instance_class:
-                hourly_cost = 0.017
-            elif 'small' in instance_class:
-                hourly_cost = 0.034
-            elif 'medium' in instance_class:
-                hourly_cost = 0.068
-            else:
-                hourly_cost = 0.10  # Default estimate
-            
-            rds_savings += hourly_cost * 24 * 30  # Monthly savings
+        rds_savings = sum(
+            estimate_hourly_cost(instance['DBInstanceClass'], RDS_HOURLY_COSTS)
+            for instance in idle_rds
+        ) * HOURS_PER_MONTH
         
         report = {
             'timestamp': datetime.utcnow().isoformat(),
@@ -253,12 +437,21 @@ def lambda_handler(event, context):
     try:
         optimizer = ResourceOptimizer()
         
-        # Identify idle resources
-        idle_ec2 = optimizer.get_idle_ec2_instances()
-        idle_rds = optimizer.get_idle_rds_instances()
+        # Identify idle resources concurrently; the lookups are independent
+        # and bound by network I/O
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            idle_ec2_future = executor.submit(optimizer.get_idle_ec2_instances)
+            idle_rds_future = executor.submit(optimizer.get_idle_rds_instances)
+            
+            idle_ec2 = idle_ec2_future.result()
+            idle_rds = idle_rds_future.result()
         
-        # Get cost recommendations
-        cost_recommendations = optimizer.get_cost_recommendations()
+        # Cost Explorer is billed per request, so only ask for recommendations
+        # when there are idle resources to act on
+        if idle_ec2 or idle_rds:
+            cost_recommendations = optimizer.get_cost_recommendations()
+        else:
+            cost_recommendations = {}
         
         # Generate report
         report = optimizer.generate_optimization_report(
@@ -275,7 +468,7 @@ def lambda_handler(event, context):
             'body': json.dumps({
                 'message': 'Resource optimization completed',
                 'report': report
-            })
+            }, separators=(',', ':'))
         }
         
     except Exception as e:
@@ -286,7 +479,7 @@ def lambda_handler(event, context):
             'body': json.dumps({
                 'message': 'Resource optimization failed',
                 'error': str(e)
-            })
+            }, separators=(',', ':'))
         }
 
 if __name__ == '__main__':
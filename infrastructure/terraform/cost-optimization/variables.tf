@@ -235,6 +235,12 @@ variable "idle_resource_threshold_days" {
   default     = 7
 }
 
+variable "resource_optimizer_memory_size" {
+  description = "Memory in MB for the resource optimizer Lambda (CPU scales with memory)"
+  type        = number
+  default     = 1024
+}
+
 # Monitoring Variables
 variable "enable_cost_monitoring_dashboard" {
   description = "Enable cost monitoring dashboard"
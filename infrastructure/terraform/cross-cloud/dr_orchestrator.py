@@ -6,25 +6,142 @@ Automates disaster recovery procedures across AWS, Azu
 
 import os
 import json
+import time
 import boto3
 import logging
-from datetime import datetime, timedelta
+import threading
+import jmespath
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Tuple
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Shared client configuration: enough pooled connections for concurrent
+# describe calls and adaptive retries to back off on throttling
+BOTO_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+# Clients are built once per container so warm invocations reuse them.
+# Creation can fail outside Lambda (e.g. no region configured), in which
+# case DisasterRecoveryOrchestrator builds its own clients on instantiation.
+try:
+    _BACKUP = boto3.client('backup', config=BOTO_CONFIG)
+    _RDS = boto3.client('rds', config=BOTO_CONFIG)
+    _EC2 = boto3.client('ec2', config=BOTO_CONFIG)
+    _S3 = boto3.client('s3', config=BOTO_CONFIG)
+    _SNS = boto3.client('sns', config=BOTO_CONFIG)
+    _CW = boto3.client('cloudwatch', config=BOTO_CONFIG)
+except Exception as e:
+    logger.warning(f"Deferring boto3 client creation: {e}")
+    _BACKUP = _RDS = _EC2 = _S3 = _SNS = _CW = None
+
+# Custom metrics are buffered during an invocation and flushed in as few
+# PutMetricData requests as possible (the API accepts up to 1000 per call)
+METRIC_NAMESPACE = 'Custom/DisasterRecovery'
+METRIC_BATCH_SIZE = 1000
+_metric_buffer: List[Dict[str, Any]] = []
+
+def flush_metrics(cloudwatch_client) -> None:
+    """Publish all buffered custom metrics to CloudWatch and clear the buffer"""
+    while _metric_buffer:
+        batch = _metric_buffer[:METRIC_BATCH_SIZE]
+        del _metric_buffer[:METRIC_BATCH_SIZE]
+        cloudwatch_client.put_metric_data(
+            Namespace=METRIC_NAMESPACE,
+            MetricData=batch
+        )
+
+# Describe results are cached per container for a short TTL so repeated
+# listings within an invocation, and warm invocations, skip the round trip
+DESCRIBE_CACHE_TTL_SECONDS = 60
+
+# Kept identical to ttl_cache in ../cost-optimization/resource_optimizer.py; each Lambda is packaged
+# from its own directory, so the two cannot share a module
+def ttl_cache(ttl: float):
+    """Memoize a function per argument tuple, expiring entries after ttl seconds"""
+    def decorator(func):
+        cache: Dict[Any, Tuple[float, Any]] = {}
+        # One lock per argument tuple, held across the call so concurrent
+        # callers share one fetch without serializing calls for other keys
+        key_locks: Dict[Any, threading.Lock] = {}
+        key_locks_lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            with key_locks_lock:
+                key_lock = key_locks.setdefault(key, threading.Lock())
+            with key_lock:
+                now = time.monotonic()
+                entry = cache.get(key)
+                if entry is not None and now - entry[0] < ttl:
+                    return entry[1]
+                
+                result = func(*args, **kwargs)
+                cache[key] = (now, result)
+                return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+# Projections applied to each response page, keeping only the fields this
+# module reads so cached listings hold small records
+_BACKUP_JOBS = jmespath.compile('BackupJobs[]')
+_RDS_SNAPSHOT_FIELDS = jmespath.compile(
+    'DBSnapshots[].{DBSnapshotIdentifier: DBSnapshotIdentifier, DBInstanceIdentifier: DBInstanceIdentifier, '
+    'SnapshotCreateTime: SnapshotCreateTime, Status: Status, Encrypted: Encrypted, AllocatedStorage: AllocatedStorage}'
+)
+_EC2_SNAPSHOT_FIELDS = jmespath.compile(
+    'Snapshots[].{SnapshotId: SnapshotId, VolumeId: VolumeId, StartTime: StartTime, State: State, '
+    'Encrypted: Encrypted, VolumeSize: VolumeSize}'
+)
+
+def _collect_pages(client, operation: str, projection, **kwargs) -> List[Dict[str, Any]]:
+    """Run a paginated describe/list call and collect the items projection selects from each page"""
+    items = []
+    for page in client.get_paginator(operation).paginate(**kwargs):
+        items.extend(projection.search(page) or [])
+    return items
+
+@ttl_cache(ttl=DESCRIBE_CACHE_TTL_SECONDS)
+def _list_rds_snapshots(rds_client) -> List[Dict[str, Any]]:
+    """List all manual RDS snapshots"""
+    return _collect_pages(
+        rds_client, 'describe_db_snapshots', _RDS_SNAPSHOT_FIELDS,
+        SnapshotType='manual',
+        PaginationConfig={'PageSize': 100}  # API maximum
+    )
+
+@ttl_cache(ttl=DESCRIBE_CACHE_TTL_SECONDS)
+def _list_ec2_snapshots(ec2_client) -> List[Dict[str, Any]]:
+    """List all settled (completed or failed) EC2 snapshots owned by this account"""
+    # In-flight snapshots are neither restorable nor old enough to expire,
+    # so let EC2 drop them server-side
+    return _collect_pages(
+        ec2_client, 'describe_snapshots', _EC2_SNAPSHOT_FIELDS,
+        OwnerIds=['self'],
+        Filters=[{'Name': 'status', 'Values': ['completed', 'error']}],
+        PaginationConfig={'PageSize': 1000}  # API maximum
+    )
+
 class DisasterRecoveryOrchestrator:
     """Main class for disaster recovery orchestration"""
     
     def __init__(self):
-        self.backup_client = boto3.client('backup')
-        self.rds_client = boto3.client('rds')
-        self.ec2_client = boto3.client('ec2')
-        self.s3_client = boto3.client('s3')
-        self.sns_client = boto3.client('sns')
-        self.cloudwatch = boto3.client('cloudwatch')
+        self.backup_client = _BACKUP or boto3.client('backup', config=BOTO_CONFIG)
+        self.rds_client = _RDS or boto3.client('rds', config=BOTO_CONFIG)
+        self.ec2_client = _EC2 or boto3.client('ec2', config=BOTO_CONFIG)
+        self.s3_client = _S3 or boto3.client('s3', config=BOTO_CONFIG)
+        self.sns_client = _SNS or boto3.client('sns', config=BOTO_CONFIG)
+        self.cloudwatch = _CW or boto3.client('cloudwatch', config=BOTO_CONFIG)
         
         self.environment = os.environ.get('ENVIRONMENT', 'dev')
         self.backup_retention_days = int(os.environ.get('BACKUP_RETENTION_DAYS', '30'))
@@ -42,13 +159,21 @@ class DisasterRecoveryOrchestrator:
                 'failed_backups': 0
             }
             
-            # Check AWS Backup jobs
-            backup_jobs = self.backup_client.list_backup_jobs(
-                ByState='COMPLETED',
-                ByCreatedAfter=datetime.utcnow() - timedelta(days=7)
-            )
+            # Fetch AWS Backup jobs, RDS snapshots and EC2 snapshots concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                backup_jobs_future = executor.submit(
+                    _collect_pages, self.backup_client, 'list_backup_jobs', _BACKUP_JOBS,
+                    ByState='COMPLETED',
+                    ByCreatedAfter=datetime.utcnow() - timedelta(days=7)
+                )
+                rds_snapshots_future = executor.submit(_list_rds_snapshots, self.rds_client)
+                ec2_snapshots_future = executor.submit(_list_ec2_snapshots, self.ec2_client)
+                
+                backup_jobs = backup_jobs_future.result()
+                rds_snapshots = rds_snapshots_future.result()
+                ec2_snapshots = ec2_snapshots_future.result()
             
-            for job in backup_jobs['BackupJobs']:
+            for job in backup_jobs:
                 results['backup_jobs'].append({
                     'backup_job_id': job['BackupJobId'],
                     'resource_arn': job['ResourceArn'],
@@ -64,12 +189,7 @@ class DisasterRecoveryOrchestrator:
                     results['failed_backups'] += 1
             
             # Check RDS snapshots
-            rds_snapshots = self.rds_client.describe_db_snapshots(
-                SnapshotType='manual',
-                MaxRecords=50
-            )
-            
-            for snapshot in rds_snapshots['DBSnapshots']:
+            for snapshot in rds_snapshots:
                 if snapshot['Status'] == 'available':
                     results['rds_snapshots'].append({
                         'snapshot_id': snapshot['DBSnapshotIdentifier'],
@@ -80,12 +200,7 @@ class DisasterRecoveryOrchestrator:
                     })
             
             # Check EC2 snapshots
-            ec2_snapshots = self.ec2_client.describe_snapshots(
-                OwnerIds=['self'],
-                MaxResults=50
-            )
-            
-            for snapshot in ec2_snapshots['Snapshots']:
+            for snapshot in ec2_snapshots:
                 if snapshot['State'] == 'completed':
                     results['ec2_snapshots'].append({
                         'snapshot_id': snapshot['SnapshotId'],
@@ -192,7 +307,7 @@ class DisasterRecoveryOrchestrator:
                 metrics['last_backup_time'] = latest_backup['CompletionDate'].isoformat()
                 
                 # Calculate RPO (time since last backup)
-                time_since_backup = datetime.utcnow() - latest_backup['CompletionDate'].replace(tzinfo=None)
+                time_since_backup = datetime.now(timezone.utc) - latest_backup['CompletionDate']
                 metrics['rpo_actual_minutes'] = int(time_since_backup.total_seconds() / 60)
             
             # Estimate RTO based on resource types and sizes
@@ -204,10 +319,9 @@ class DisasterRecoveryOrchestrator:
                 metrics['rto_estimate_minutes'] += 30  # Additional time for cross-region
                 metrics['recovery_complexity'] = 'high'
             
-            # Send custom metrics to CloudWatch
-            self.cloudwatch.put_metric_data(
-                Namespace='Custom/DisasterRecovery',
-                MetricData=[
+            # Queue custom metrics for CloudWatch; they are flushed at handler exit
+            _metric_buffer.extend(
+                [
                     {
                         'MetricName': 'RPOActualMinutes',
                         'Value': metrics['rpo_actual_minutes'],
@@ -260,41 +374,42 @@ class DisasterRecoveryOrchestrator:
                 'space_freed_gb': 0
             }
             
-            cutoff_date = datetime.utcnow() - timedelta(days=self.backup_retention_days)
+            # boto3 returns tz-aware timestamps, so compare against an aware cutoff
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.backup_retention_days)
             
-            # Clean up old RDS snapshots
-            rds_snapshots = self.rds_client.describe_db_snapshots(
-                SnapshotType='manual'
-            )
+            # Fetch RDS and EC2 snapshots concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                rds_snapshots_future = executor.submit(_list_rds_snapshots, self.rds_client)
+                ec2_snapshots_future = executor.submit(_list_ec2_snapshots, self.ec2_client)
+                
+                rds_snapshots = rds_snapshots_future.result()
+                ec2_snapshots = ec2_snapshots_future.result()
             
-            for snapshot in rds_snapshots['DBSnapshots']:
-                if snapshot['SnapshotCreateTime'].replace(tzinfo=None) < cutoff_date:
+            # Clean up old RDS snapshots
+            for snapshot in rds_snapshots:
+                if snapshot['SnapshotCreateTime'] < cutoff_date:
                     logger.info(f"Would delete old RDS snapshot: {snapshot['DBSnapshotIdentifier']}")
                     cleanup_results['deleted_snapshots'].append({
                         'type': 'rds',
                         'id': snapshot['DBSnapshotIdentifier'],
                         'creation_time': snapshot['SnapshotCreateTime'].isoformat(),
-                        'size_gb': snapshot.get('AllocatedStorage', 0)
+                        'size_gb': (snapshot['AllocatedStorage'] or 0)
                     })
                     cleanup_results['total_deleted'] += 1
-                    cleanup_results['space_freed_gb'] += snapshot.get('AllocatedStorage', 0)
+                    cleanup_results['space_freed_gb'] += (snapshot['AllocatedStorage'] or 0)
             
             # Clean up old EC2 snapshots
-            ec2_snapshots = self.ec2_client.describe_snapshots(
-                OwnerIds=['self']
-            )
-            
-            for snapshot in ec2_snapshots['Snapshots']:
-                if snapshot['StartTime'].replace(tzinfo=None) < cutoff_date:
+            for snapshot in ec2_snapshots:
+                if snapshot['StartTime'] < cutoff_date:
                     logger.info(f"Would delete old EC2 snapshot: {snapshot['SnapshotId']}")
                     cleanup_results['deleted_snapshots'].append({
                         'type': 'ec2',
                         'id': snapshot['SnapshotId'],
                         'creation_time': snapshot['StartTime'].isoformat(),
-                        'size_gb': snapshot.get('VolumeSize', 0)
+                        'size_gb': (snapshot['VolumeSize'] or 0)
                     })
                     cleanup_results['total_deleted'] += 1
-                    cleanup_results['space_freed_gb'] += snapshot.get('VolumeSize', 0)
+                    cleanup_results['space_freed_gb'] += (snapshot['VolumeSize'] or 0)
             
             return True, f"Cleanup completed. {cleanup_results['total_deleted']} old backups identified for deletion", cleanup_results
             
@@ -390,6 +505,7 @@ Full report attached as JSON.
 def lambda_handler(event, context):
     """Lambda function entry point"""
     
+    orchestrator = None
     try:
         orchestrator = DisasterRecoveryOrchestrator()
         
@@ -399,17 +515,19 @@ def lambda_handler(event, context):
         
         logger.info(f"Starting disaster recovery orchestration: {action}")
         
-        # Run backup integrity test
-        backup_test = orchestrator.test_backup_integrity()
-        
-        # Run recovery procedures test
-        recovery_test = orchestrator.test_recovery_procedures(dry_run=dry_run)
-        
-        # Calculate RTO/RPO metrics
-        rto_rpo_metrics = orchestrator.calculate_rto_rpo_metrics()
-        
-        # Clean up old backups
-        cleanup_results = orchestrator.cleanup_old_backups()
+        # The backup integrity test, RTO/RPO calculation and backup cleanup are
+        # independent and I/O bound, so run them concurrently on the shared clients
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            backup_test_future = executor.submit(orchestrator.test_backup_integrity)
+            rto_rpo_future = executor.submit(orchestrator.calculate_rto_rpo_metrics)
+            cleanup_future = executor.submit(orchestrator.cleanup_old_backups)
+            
+            # Run recovery procedures test
+            recovery_test = orchestrator.test_recovery_procedures(dry_run=dry_run)
+            
+            backup_test = backup_test_future.result()
+            rto_rpo_metrics = rto_rpo_future.result()
+            cleanup_results = cleanup_future.result()
         
         # Generate comprehensive report
         report = orchestrator.generate_dr_report(
@@ -426,7 +544,7 @@ def lambda_handler(event, context):
             'body': json.dumps({
                 'message': 'Disaster recovery orchestration completed',
                 'report': report
-            })
+            }, separators=(',', ':'))
         }
         
     except Exception as e:
@@ -437,8 +555,16 @@ def lambda_handler(event, context):
             'body': json.dumps({
                 'message': 'Disaster recovery orchestration failed',
                 'error': str(e)
-            })
+            }, separators=(',', ':'))
         }
+    
+    finally:
+        # Publish all custom metrics queued during this invocation
+        if orchestrator is not None:
+            try:
+                flush_metrics(orchestrator.cloudwatch)
+            except Exception as e:
+                logger.error(f"Error publishing custom metrics: {e}")
 
 if __name__ == '__main__':
     # For local testing
@@ -538,7 +538,9 @@ resource "aws_lambda_function" "disaster_recovery_orchestrator" {
   function_name    = "${var.environment}-dr-orchestrator"
   role            = aws_iam_role.dr_orchestrator[0].arn
   handler         = "index.handler"
-  runtime         = "python3.9"
+  runtime         = "python3.12"  # SnapStart for Python requires 3.12+
+  memory_size     = var.dr_orchestrator_memory_size
+  publish         = true
   timeout         = 900  # 15 minutes
 
   environment {
@@ -549,6 +551,12 @@ resource "aws_lambda_function" "disaster_recovery_orchestrator" {
     }
   }
 
+  # Restore the initialized module (imports and boto3 clients) from a
+  # snapshot instead of re-running it on cold start
+  snap_start {
+    apply_on = "PublishedVersions"
+  }
+
   tags = var.common_tags
 }
 
@@ -625,7 +633,7 @@ resource "aws_cloudwatch_event_target" "dr_testing_lambda" {
   
   rule      = aws_cloudwatch_event_rule.dr_testing[0].name
   target_id = "DRTestingTarget"
-  arn       = aws_lambda_function.disaster_recovery_orchestrator[0].arn
+  arn       = aws_lambda_function.disaster_recovery_orchestrator[0].qualified_arn
 
   input = jsonencode({
     action = "test_dr_procedures"
@@ -639,6 +647,7 @@ resource "aws_lambda_permission" "allow_cloudwatch_dr" {
   statement_id  = "AllowExecutionFromCloudWatchDR"
   action        = "lambda:InvokeFunction"
   function_name = aws_lambda_function.disaster_recovery_orchestrator[0].function_name
+  qualifier     = aws_lambda_function.disaster_recovery_orchestrator[0].version
   principal     = "events.amazonaws.com"
   source_arn    = aws_cloudwatch_event_rule.dr_testing[0].arn
 }
@@ -172,6 +172,12 @@ variable "backup_retention_days" {
   default     = 30
 }
 
+variable "dr_orchestrator_memory_size" {
+  description = "Memory in MB for the disaster recovery orchestrator Lambda (CPU scales with memory)"
+  type        = number
+  default     = 1024
+}
+
 variable "cross_region_replication_enabled" {
   description = "Enable cross-region replication for disaster recovery"
   type        = bool
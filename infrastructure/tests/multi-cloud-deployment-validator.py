@@ -10,12 +10,27 @@ import json
 import time
 import logging
 import argparse
+import functools
+import importlib
+import threading
 import subprocess
 import concurrent.futures
 from typing import Dict, List, Any, Tuple, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 
+# orjson is optional; fall back to the stdlib parser when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# fastjsonschema is optional; config validation is skipped without it
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,7 +42,121 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Shape of the validation config. cloud_config must match the
+# CloudConfiguration fields exactly since it is splatted into the dataclass
+CONFIG_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'cloud_config': {
+            'type': 'object',
+            'properties': {
+                'aws_region': {'type': 'string'},
+                'azure_location': {'type': 'string'},
+                'gcp_region': {'type': 'string'},
+                'gcp_project_id': {'type': 'string'},
+                'environment': {'type': 'string'}
+            },
+            'additionalProperties': False
+        },
+        'validation_config': {
+            'type': 'object',
+            'properties': {
+                'timeout_seconds': {'type': 'number', 'exclusiveMinimum': 0},
+                'parallel_execution': {'type': 'boolean'},
+                'detailed_reporting': {'type': 'boolean'}
+            }
+        },
+        'azure': {
+            'type': 'object',
+            'properties': {
+                'subscription_id': {'type': 'string'}
+            }
+        },
+        'gcp': {
+            'type': 'object',
+            'properties': {
+                'credentials_path': {'type': 'string'}
+            }
+        }
+    }
+}
+
+# Compiled once at import so every validator instance shares it
+_validate_config = fastjsonschema.compile(CONFIG_SCHEMA) if fastjsonschema is not None else None
+_CONFIG_SCHEMA_ERRORS = (fastjsonschema.JsonSchemaException,) if fastjsonschema is not None else ()
+
+# Connection pool size for AWS clients, sized for parallel validations so
+# concurrent calls are not capped at botocore's default of 10
+AWS_MAX_POOL_CONNECTIONS = 64
+
+# Retry policy for AWS clients: adaptive mode rate-limits client-side when
+# throttled instead of retrying blindly
+AWS_RETRY_CONFIG = {'max_attempts': 2, 'mode': 'adaptive'}
+
+# Connection pool size of the HTTP session shared by all Azure clients
+AZURE_MAX_POOL_CONNECTIONS = 64
+
+# AWS clients created on first access: attribute name -> boto3 service name
+AWS_CLIENT_SERVICES = {
+    'aws_ec2': 'ec2',
+    'aws_eks': 'eks',
+    'aws_rds': 'rds',
+    'aws_s3': 's3',
+    'aws_backup': 'backup',
+    'aws_budgets': 'budgets',
+    'aws_ce': 'ce',
+    'aws_lambda': 'lambda',
+    'aws_cloudwatch': 'cloudwatch'
+}
+
+# Credential cache shared with the AWS CLI, so assume-role credentials
+# survive across runs instead of costing an STS call each time
+AWS_CREDENTIAL_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.aws', 'cli', 'cache')
+
+# Azure management clients created on first access:
+# attribute name -> (module, client class)
+AZURE_CLIENT_CLASSES = {
+    'azure_resource_client': ('azure.mgmt.resource', 'ResourceManagementClient'),
+    'azure_network_client': ('azure.mgmt.network', 'NetworkManagementClient'),
+    'azure_aks_client': ('azure.mgmt.containerservice', 'ContainerServiceClient'),
+    'azure_sql_client': ('azure.mgmt.sql', 'SqlManagementClient')
+}
+
+# GCP clients created on first access: attribute name -> (module, client class)
+GCP_CLIENT_CLASSES = {
+    'gcp_container_client': ('google.cloud.container_v1', 'ClusterManagerClient'),
+    'gcp_compute_client': ('google.cloud.compute_v1', 'InstancesClient'),
+    'gcp_sql_client': ('google.cloud.sql_v1', 'SqlInstancesServiceClient')
+}
+
+@functools.lru_cache(maxsize=None)
+def _shared_aws_session(region_name: str):
+    """Process-wide boto3 Session per region, with assume-role credentials cached on disk"""
+    import boto3
+    from botocore.credentials import JSONFileCache
+    
+    session = boto3.Session(region_name=region_name)
+    try:
+        provider = session._session.get_component('credential_provider').get_provider('assume-role')
+        provider.cache = JSONFileCache(AWS_CREDENTIAL_CACHE_DIR)
+    except Exception as e:
+        logger.debug(f"AWS credential cache not enabled: {e}")
+    return session
+
+@functools.lru_cache(maxsize=None)
+def _parse_config_file(config_file: str, mtime_ns: int) -> Dict:
+    """Parse and schema-check a config file, memoized per path and modification time"""
+    with open(config_file, 'rb') as f:
+        if orjson is not None:
+            config = orjson.loads(f.read())
+        else:
+            config = json.load(f)
+    
+    if _validate_config is not None:
+        _validate_config(config)
+    return config
+
+@dataclass(slots=True)
 class ValidationResult:
     """Validation result data class"""
     test_name: str
@@ -40,7 +169,7 @@ class ValidationResult:
     details: Optional[Dict[str, Any]] = None
     recommendations: Optional[List[str]] = None
 
-@dataclass
+@dataclass(slots=True)
 class CloudConfiguration:
     """Cloud configuration data class"""
     aws_region: str = "us-west-2"
@@ -58,16 +187,25 @@ class MultiCloudDeploymentValidator:
         self.cloud_config = CloudConfiguration(**self.config.get('cloud_config', {}))
         self.results: List[ValidationResult] = []
         
-        # Initialize cloud clients
-        self._init_aws_clients()
-        self._init_azure_clients()
-        self._init_gcp_clients()
+        # Guards first-access creation of lazy AWS/Azure clients
+        self._client_lock = threading.Lock()
+        
+        # Initialize cloud clients; each provider's SDK import and credential
+        # resolution is I/O bound and independent, so run them concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            init_futures = [
+                executor.submit(init)
+                for init in (self._init_aws_clients, self._init_azure_clients, self._init_gcp_clients)
+            ]
+            for future in init_futures:
+                future.result()
     
     def _load_config(self, config_file: str) -> Dict:
         """Load validation configuration"""
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            # Validators built from the same unchanged file share one parsed
+            # config; it is treated as read-only
+            return _parse_config_file(config_file, os.stat(config_file).st_mtime_ns)
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {config_file}")
             # Return default configuration
@@ -83,23 +221,30 @@ class MultiCloudDeploymentValidator:
                 }
             }
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so this
+            # covers both parsers
             logger.error(f"Invalid JSON in configuration file: {e}")
             sys.exit(1)
+        except _CONFIG_SCHEMA_ERRORS as e:
+            logger.error(f"Invalid configuration file: {e.message}")
+            sys.exit(1)
     
     def _init_aws_clients(self):
         """Initialize AWS clients"""
+        if not self._provider_enabled('aws'):
+            logger.info("AWS validation disabled, skipping client setup")
+            self.aws_session = None
+            return
+        
         try:
-            import boto3
-            self.aws_session = boto3.Session(region_name=self.cloud_config.aws_region)
-            self.aws_ec2 = self.aws_session.client('ec2')
-            self.aws_eks = self.aws_session.client('eks')
-            self.aws_rds = self.aws_session.client('rds')
-            self.aws_s3 = self.aws_session.client('s3')
-            self.aws_backup = self.aws_session.client('backup')
-            self.aws_budgets = self.aws_session.client('budgets')
-            self.aws_ce = self.aws_session.client('ce')
-            self.aws_lambda = self.aws_session.client('lambda')
-            self.aws_cloudwatch = self.aws_session.client('cloudwatch')
+            from botocore.config import Config
+            # Service clients are created on first access (see __getattr__)
+            self.aws_session = _shared_aws_session(self.cloud_config.aws_region)
+            self.aws_client_config = Config(
+                max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+                retries=AWS_RETRY_CONFIG,
+                tcp_keepalive=True
+            )
             logger.info("✅ AWS clients initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize AWS clients: {e}")
@@ -107,66 +252,120 @@ class MultiCloudDeploymentValidator:
     
     def _init_azure_clients(self):
         """Initialize Azure clients"""
+        subscription_id = self.config.get('azure', {}).get('subscription_id', 
+                                                          os.environ.get('AZURE_SUBSCRIPTION_ID'))
+        if not self._provider_enabled('azure'):
+            logger.info("Azure validation disabled, skipping client setup")
+            self.azure_credential = None
+            return
+        if not subscription_id:
+            # Checked before importing so the Azure SDK is never loaded
+            logger.warning("⚠️ Azure subscription ID not provided")
+            self.azure_credential = None
+            return
+        
         try:
-            from azure.identity import DefaultAzureCredential
-            from azure.mgmt.resource import ResourceManagementClient
-            from azure.mgmt.network import NetworkManagementClient
-            from azure.mgmt.containerservice import ContainerServiceClient
-            from azure.mgmt.sql import SqlManagementClient
+            import requests
+            from azure.core.pipeline.transport import RequestsTransport
+            from azure.identity import (
+                AzureCliCredential,
+                ChainedTokenCredential,
+                EnvironmentCredential,
+                ManagedIdentityCredential
+            )
             
-            self.azure_credential = DefaultAzureCredential()
-            subscription_id = self.config.get('azure', {}).get('subscription_id', 
-                                                              os.environ.get('AZURE_SUBSCRIPTION_ID'))
-            if subscription_id:
-                self.azure_resource_client = ResourceManagementClient(
-                    self.azure_credential, subscription_id
-                )
-                self.azure_network_client = NetworkManagementClient(
-                    self.azure_credential, subscription_id
-                )
-                self.azure_aks_client = ContainerServiceClient(
-                    self.azure_credential, subscription_id
-                )
-                self.azure_sql_client = SqlManagementClient(
-                    self.azure_credential, subscription_id
-                )
-                logger.info("✅ Azure clients initialized successfully")
-            else:
-                logger.warning("⚠️ Azure subscription ID not provided")
-                self.azure_credential = None
+            # Only the sources used in CI (service principal env vars, managed
+            # identity) and locally (az login), cheapest first; the shared
+            # instance caches the ARM token for every management client
+            self.azure_credential = ChainedTokenCredential(
+                EnvironmentCredential(),
+                ManagedIdentityCredential(),
+                AzureCliCredential()
+            )
+            
+            # Management clients are created on first access (see __getattr__)
+            # and share one keep-alive HTTP session instead of one each
+            self.azure_subscription_id = subscription_id
+            http_session = requests.Session()
+            http_session.mount('https://', requests.adapters.HTTPAdapter(
+                pool_maxsize=AZURE_MAX_POOL_CONNECTIONS
+            ))
+            self.azure_transport = RequestsTransport(session=http_session, session_owner=False)
+            logger.info("✅ Azure clients initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize Azure clients: {e}")
             self.azure_credential = None
     
+    def __getattr__(self, name: str) -> Any:
+        """Create AWS, Azure and GCP service clients on first access and memoize them"""
+        if name in AWS_CLIENT_SERVICES:
+            session = self.__dict__.get('aws_session')
+            if session is None:
+                raise AttributeError(f"{name} unavailable: AWS session not initialized")
+            factory = functools.partial(
+                session.client, AWS_CLIENT_SERVICES[name], config=self.aws_client_config
+            )
+        elif name in AZURE_CLIENT_CLASSES:
+            credential = self.__dict__.get('azure_credential')
+            subscription_id = self.__dict__.get('azure_subscription_id')
+            if credential is None or not subscription_id:
+                raise AttributeError(f"{name} unavailable: Azure credentials not initialized")
+            factory = functools.partial(
+                self._import_client_class(name, AZURE_CLIENT_CLASSES[name]), credential, subscription_id,
+                transport=self.__dict__.get('azure_transport')
+            )
+        elif name in GCP_CLIENT_CLASSES:
+            if 'gcp_credentials' not in self.__dict__:
+                raise AttributeError(f"{name} unavailable: GCP credentials not initialized")
+            factory = functools.partial(
+                self._import_client_class(name, GCP_CLIENT_CLASSES[name]),
+                credentials=self.gcp_credentials
+            )
+        else:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        
+        # boto3 client creation is not thread-safe, and clients may be requested from several threads
+        with self._client_lock:
+            if name not in self.__dict__:
+                self.__dict__[name] = factory()
+            return self.__dict__[name]
+    
+    @staticmethod
+    def _import_client_class(name: str, client_class_path: Tuple[str, str]) -> Any:
+        """Import a lazily created client's class, reporting a missing SDK as AttributeError"""
+        module_name, class_name = client_class_path
+        try:
+            return getattr(importlib.import_module(module_name), class_name)
+        except ImportError as e:
+            raise AttributeError(f"{name} unavailable: {e}") from e
+    
+    def _provider_enabled(self, provider: str) -> bool:
+        """Whether a cloud provider is enabled in the config (<provider>.enabled, default true)"""
+        return self.config.get(provider, {}).get('enabled', True)
+    
     def _init_gcp_clients(self):
         """Initialize GCP clients"""
+        if not self._provider_enabled('gcp'):
+            logger.info("GCP validation disabled, skipping client setup")
+            return
+        
         try:
-            from google.cloud import container_v1
-            from google.cloud import compute_v1
-            from google.cloud import sql_v1
-            from google.oauth2 import service_account
-            
             credentials_path = self.config.get('gcp', {}).get('credentials_path')
             if credentials_path and os.path.exists(credentials_path):
+                from google.oauth2 import service_account
                 credentials = service_account.Credentials.from_service_account_file(
                     credentials_path
                 )
             else:
+                # Application default credentials
                 credentials = None
             
-            self.gcp_container_client = container_v1.ClusterManagerClient(
-                credentials=credentials
-            )
-            self.gcp_compute_client = compute_v1.InstancesClient(
-                credentials=credentials
-            )
-            self.gcp_sql_client = sql_v1.SqlInstancesServiceClient(
-                credentials=credentials
-            )
+            # Service clients, and the google.cloud modules behind them, are
+            # loaded on first access (see __getattr__)
+            self.gcp_credentials = credentials
             logger.info("✅ GCP clients initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize GCP clients: {e}")
-            self.gcp_container_client = None
 
 if __name__ == '__main__':
     print("Multi-Cloud Deployment Validator initialized")
\ No newline at end of file
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the cost optimization Lambda
+Imports the handler module so a broken import fails before deployment
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+RESOURCE_OPTIMIZER_PATH = (
+    Path(__file__).resolve().parent.parent
+    / 'terraform' / 'cost-optimization' / 'resource_optimizer.py'
+)
+
+def test_resource_optimizer_imports():
+    """The module imports cleanly and exposes the Lambda handler"""
+    pytest.importorskip('boto3')
+    pytest.importorskip('jmespath')
+
+    spec = importlib.util.spec_from_file_location('resource_optimizer', RESOURCE_OPTIMIZER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert callable(module.lambda_handler)
@@ -1,56 +1,103 @@
 import sys
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import os
+import re
+import functools
+import logging
+import textwrap
 from datetime import datetime, timezone
 from uuid import uuid4
 
+# orjson when available, for faster workflow/input parsing and log encoding;
+# its JSONDecodeError subclasses json's, so error handling is unchanged
+try:
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
 print("--- run_flow.py started (absolute top) ---", file=sys.stderr) # Added for debugging
 
-# Ensure logs directory exists and is writable
+# Ensure logs directory exists and is writable, touching it only when
+# it is missing or has the wrong mode
 LOGS_DIR = "/app/logs"
-os.makedirs(LOGS_DIR, exist_ok=True)
-os.chmod(LOGS_DIR, 0o777)  # Make sure it's writable
-
-# Emergency logging to capture sys.argv at the very start (explicit file write)
 try:
-    with open(os.path.join(LOGS_DIR, 'argv_debug.log'), 'w') as f:
-        f.write(f'sys.argv (emergency): {sys.argv}\n')
-        f.flush()
-except Exception as e:
-    # Fallback print if file write fails
-    print(f'Emergency log file write failed: {e}', file=sys.stderr)
-
-# Function to write debug information to a log file
-def write_debug_log(message):
+    _needs_chmod = (os.stat(LOGS_DIR).st_mode & 0o777) != 0o777
+except FileNotFoundError:
+    os.makedirs(LOGS_DIR, exist_ok=True)
+    _needs_chmod = True
+if _needs_chmod:
+    os.chmod(LOGS_DIR, 0o777)  # Make sure it's writable
+
+# Shared HTTP session so Ollama calls reuse a pooled keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Emergency logging to capture sys.argv at the very start (explicit file write),
+# only when debugging is enabled
+if os.getenv('FLOW_DEBUG'):
     try:
-        with open(os.path.join(LOGS_DIR, 'debug.log'), 'a') as f:
-            f.write(f'{datetime.now(timezone.utc).isoformat()} - {message}\n')
+        with open(os.path.join(LOGS_DIR, 'argv_debug.log'), 'w') as f:
+            f.write(f'sys.argv (emergency): {sys.argv}\n')
             f.flush()
     except Exception as e:
-        # Fallback to printing if writing to file fails
-        print(f'Failed to write debug log file: {e}', file=sys.stderr)
-        print(f'DEBUG (fallback): {message}', file=sys.stderr)
+        # Fallback print if file write fails
+        print(f'Emergency log file write failed: {e}', file=sys.stderr)
+
+# Debug log with a persistent handle; debug messages are only formatted
+# and written when FLOW_DEBUG is set, errors always are
+debug_log = logging.getLogger('run_flow')
+_debug_handler = logging.FileHandler(os.path.join(LOGS_DIR, 'debug.log'), delay=True)
+_debug_formatter = logging.Formatter('%(asctime)s - %(message)s')
+_debug_formatter.converter = time.gmtime
+_debug_handler.setFormatter(_debug_formatter)
+debug_log.addHandler(_debug_handler)
+debug_log.setLevel(logging.DEBUG if os.getenv('FLOW_DEBUG') else logging.WARNING)
+debug_log.propagate = False
 
 def load_workflow(path):
-    write_debug_log(f"Attempting to load workflow from path: {path}")
+    debug_log.debug("Attempting to load workflow from path: %s", path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        debug_log.error("Error: Workflow file not found at path: %s", path)
+        raise
+    return _parse_workflow(path, st.st_mtime_ns, st.st_size)
+
+# Parsed workflows keyed on path, mtime and size, so an unchanged flow file
+# is parsed once per process
+@functools.lru_cache(maxsize=32)
+def _parse_workflow(path, mtime_ns, size):
     try:
         with open(path, 'r') as f:
-            flow = json.load(f)
-            write_debug_log(f"Successfully loaded workflow JSON.")
-            write_debug_log(f"Type of loaded workflow: {type(flow).__name__}")
+            flow = json_loads(f.read())
+            debug_log.debug("Successfully loaded workflow JSON.")
+            debug_log.debug("Type of loaded workflow: %s", type(flow).__name__)
             if isinstance(flow, dict):
-                 write_debug_log(f"Top-level keys present: {list(flow.keys())}")
+                 debug_log.debug("Top-level keys present: %s", list(flow.keys()))
                  # Handle both old and new workflow formats
                  if 'data' in flow:
-                     write_debug_log("Found 'data' key in workflow.")
+                     debug_log.debug("Found 'data' key in workflow.")
                      if isinstance(flow['data'], dict):
-                         write_debug_log(f"Content of 'data' is a dictionary. Keys present: {list(flow['data'].keys())}")
+                         debug_log.debug("Content of 'data' is a dictionary. Keys present: %s", list(flow['data'].keys()))
                          if 'nodes' in flow['data'] and 'edges' in flow['data']:
-                             write_debug_log("Found 'nodes' and 'edges' under 'data'.")
+                             debug_log.debug("Found 'nodes' and 'edges' under 'data'.")
                              if isinstance(flow['data']['nodes'], list) and isinstance(flow['data']['edges'], list):
-                                  write_debug_log("'data.nodes' and 'data.edges' are lists.")
+                                  debug_log.debug("'data.nodes' and 'data.edges' are lists.")
                                   return {
                                       'nodes': flow['data']['nodes'],
                                       'edges': flow['data']['edges']
@@ -58,85 +105,107 @@ def load_workflow(path):
                              else:
                                  nodes_type = type(flow['data']['nodes']).__name__
                                  edges_type = type(flow['data']['edges']).__name__
-                                 write_debug_log(f"Error: 'data.nodes' or 'data.edges' are not lists. Nodes type: {nodes_type}, Edges type: {edges_type}")
+                                 debug_log.error("Error: 'data.nodes' or 'data.edges' are not lists. Nodes type: %s, Edges type: %s", nodes_type, edges_type)
                                  raise ValueError(f"Workflow data has nodes/edges but they are not lists. Nodes type: {nodes_type}, Edges type: {edges_type}")
                          else:
-                              write_debug_log(f"Error: Missing 'nodes' or 'edges' under 'data' key. Found keys under data: {list(flow['data'].keys())}")
+                              debug_log.error("Error: Missing 'nodes' or 'edges' under 'data' key. Found keys under data: %s", list(flow['data'].keys()))
                               raise ValueError(f"Workflow data missing required keys ('nodes' or 'edges') under 'data'. Found keys: {list(flow['data'].keys())}")
                      else:
-                         write_debug_log(f"Error: Content of 'data' is not a dictionary. Type: {type(flow['data']).__name__}")
+                         debug_log.error("Error: Content of 'data' is not a dictionary. Type: %s", type(flow['data']).__name__)
                          raise ValueError(f"Workflow has 'data' key, but its content is not a dictionary. Type: {type(flow['data']).__name__}")
 
-                 write_debug_log("No 'data' key found, attempting to use root level nodes and edges.")
+                 debug_log.debug("No 'data' key found, attempting to use root level nodes and edges.")
                  if 'nodes' in flow and 'edges' in flow:
-                     write_debug_log("Found 'nodes' and 'edges' at root level.")
+                     debug_log.debug("Found 'nodes' and 'edges' at root level.")
                      if isinstance(flow['nodes'], list) and isinstance(flow['edges'], list):
-                         write_debug_log("Root level 'nodes' and 'edges' are lists.")
+                         debug_log.debug("Root level 'nodes' and 'edges' are lists.")
                          return flow
                      else:
                          nodes_type = type(flow['nodes']).__name__
                          edges_type = type(flow['edges']).__name__
-                         write_debug_log(f"Error: Root level 'nodes' or 'edges' are not lists. Nodes type: {nodes_type}, Edges type: {edges_type}")
+                         debug_log.error("Error: Root level 'nodes' or 'edges' are not lists. Nodes type: %s, Edges type: %s", nodes_type, edges_type)
                          raise ValueError(f"Workflow has root level nodes/edges but they are not lists. Nodes type: {nodes_type}, Edges type: {edges_type}")
 
             # If neither format worked or not a dictionary
-            write_debug_log("Error: Workflow does not contain expected keys or is not a dictionary.")
+            debug_log.error("Error: Workflow does not contain expected keys or is not a dictionary.")
             raise ValueError("Workflow must be a dictionary containing 'data.nodes'/'data.edges' or root level 'nodes'/'edges' as lists.")
 
     except FileNotFoundError:
-        write_debug_log(f"Error: Workflow file not found at path: {path}")
+        debug_log.error("Error: Workflow file not found at path: %s", path)
         raise
     except json.JSONDecodeError as e:
-        write_debug_log(f"Error: Failed to parse workflow JSON: {e}")
+        debug_log.error("Error: Failed to parse workflow JSON: %s", e)
         raise
     except Exception as e:
-        write_debug_log(f"Unexpected error loading workflow: {e}")
+        debug_log.error("Unexpected error loading workflow: %s", e)
         raise
 
+# A {key} placeholder; any text without braces, matching what the
+# per-key str.replace loop substituted
+_PLACEHOLDER = re.compile(r'\{([^{}]+)\}')
+
+def render_template(template, input_data):
+    if not isinstance(input_data, dict):
+        return template
+    values = {key: str(value) for key, value in input_data.items()}
+    # Single pass over the template instead of one replace() per key;
+    # placeholders with no matching input are left untouched
+    return _PLACEHOLDER.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+_LANGFLOW_KIND = re.compile(r'(ChatInput|Prompt)')
+_LANGFLOW_KINDS = {'ChatInput': 'chat_input', 'Prompt': 'prompt'}
+
+def index_nodes(nodes):
+    # First node of each kind extract_prompt looks for, found in one pass
+    found = {'input': None, 'chat_input': None, 'prompt': None}
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        data = node.get('data', {})
+        if found['input'] is None and node.get('type') == 'InputNode' and 'input' in data:
+            found['input'] = node
+        # LangFlow ids start with the component name; types may embed it.
+        # Id and type are checked independently, so a node can count as
+        # both kinds when they name different components
+        names = set(_LANGFLOW_KIND.findall(str(node.get('type') or data.get('type') or '')))
+        id_match = _LANGFLOW_KIND.match(str(node.get('id') or data.get('id') or ''))
+        if id_match:
+            names.add(id_match.group(1))
+        for name in names:
+            kind = _LANGFLOW_KINDS[name]
+            if found[kind] is None:
+                found[kind] = node
+    return found
+
 def extract_prompt(flow, input_data):
     # Add robust check for 'nodes' key and list type
     if not isinstance(flow, dict) or 'nodes' not in flow or not isinstance(flow['nodes'], list):
         error_msg = f"Error in extract_prompt: Expected flow to be a dictionary with a list 'nodes' key. Got type: {type(flow).__name__}, Keys: {list(flow.keys()) if isinstance(flow, dict) else 'N/A'}"
         print(error_msg, file=sys.stderr)
-        write_debug_log(error_msg)
+        debug_log.error(error_msg)
         raise ValueError("Invalid flow structure passed to extract_prompt: Missing or invalid 'nodes' key.")
 
-    write_debug_log(f"extract_prompt received flow keys: {list(flow.keys())}")
-    write_debug_log(f"extract_prompt received input_data: {input_data}")
+    debug_log.debug("extract_prompt received flow keys: %s", list(flow.keys()))
+    debug_log.debug("extract_prompt received input_data: %s", input_data)
+
+    nodes_by_kind = index_nodes(flow['nodes'])
 
     # 1. Try simple InputNode (legacy/simple flows)
-    for node in flow['nodes']:
-        if not isinstance(node, dict):
-            continue
-        if node.get('type') == 'InputNode' and 'data' in node and 'input' in node['data']:
-            template = node['data']['input']
-            write_debug_log(f"Found simple InputNode with template: {template}")
-            processed_template = template
-            if isinstance(input_data, dict):
-                for key, value in input_data.items():
-                    placeholder = '{' + key + '}'
-                    processed_template = processed_template.replace(placeholder, str(value))
-            return processed_template
+    input_node = nodes_by_kind['input']
+    if input_node is not None:
+        template = input_node['data']['input']
+        debug_log.debug("Found simple InputNode with template: %s", template)
+        return render_template(template, input_data)
 
     # 2. Try LangFlow (ChatInput + Prompt node)
-    # Find ChatInput node (by id or type)
+    chat_input_node = nodes_by_kind['chat_input']
     chat_input_id = None
-    for node in flow['nodes']:
-        node_id = node.get('id') or node.get('data', {}).get('id')
-        node_type = node.get('type') or node.get('data', {}).get('type')
-        if (node_id and str(node_id).startswith('ChatInput')) or (node_type and 'ChatInput' in str(node_type)):
-            chat_input_id = node_id
-            write_debug_log(f"Found ChatInput node with id: {chat_input_id}")
-            break
+    if chat_input_node is not None:
+        chat_input_id = chat_input_node.get('id') or chat_input_node.get('data', {}).get('id')
+        debug_log.debug("Found ChatInput node with id: %s", chat_input_id)
     if chat_input_id:
-        # Find Prompt node connected to ChatInput
-        prompt_node = None
-        for node in flow['nodes']:
-            node_id = node.get('id') or node.get('data', {}).get('id')
-            node_type = node.get('type') or node.get('data', {}).get('type')
-            if (node_id and str(node_id).startswith('Prompt')) or (node_type and 'Prompt' in str(node_type)):
-                prompt_node = node
-                break
+        # Prompt node connected to ChatInput
+        prompt_node = nodes_by_kind['prompt']
         if prompt_node:
             # Try to get template from Prompt node
             template = None
@@ -147,62 +216,112 @@ def extract_prompt(flow, input_data):
                 # Fallback: node['data']['template']['value']
                 template = prompt_node.get('data', {}).get('template', {}).get('value')
             if template:
-                write_debug_log(f"Found LangFlow Prompt node with template: {template}")
-                processed_template = template
-                if isinstance(input_data, dict):
-                    for key, value in input_data.items():
-                        placeholder = '{' + key + '}'
-                        processed_template = processed_template.replace(placeholder, str(value))
-                return processed_template
+                debug_log.debug("Found LangFlow Prompt node with template: %s", template)
+                return render_template(template, input_data)
             else:
-                write_debug_log("Prompt node found but no template value present.")
+                debug_log.debug("Prompt node found but no template value present.")
 
     # 3. Fallback: Error
-    write_debug_log("Error: Input node with 'input' or Prompt template not found in flow nodes, or node structure is unexpected.")
+    debug_log.error("Error: Input node with 'input' or Prompt template not found in flow nodes, or node structure is unexpected.")
     raise ValueError("Input node with expected structure not found in flow nodes.")
 
-def run_ollama(prompt, log_file):
+def run_ollama(prompt, log):
     ollama_host = os.getenv('OLLAMA_HOST', 'http://ollama:11434')
     url = f"{ollama_host}/api/generate"
+    # Streamed: Ollama sends one JSON object per line as tokens are generated
     data = {
         "model": "tinyllama",
         "prompt": prompt,
-        "stream": False
+        "stream": True
     }
     
-    with open(log_file, 'a') as log:
-        log.write(f"Sending request to Ollama: {prompt}\n")
+    log.write(f"Sending request to Ollama: {prompt}\n")
+    # Make progress visible while waiting on the model
+    log.flush()
     
     try:
-        response = requests.post(url, json=data, timeout=60)
-        if response.status_code == 200:
-            result = response.json().get('response', '')
-            with open(log_file, 'a') as log:
-                log.write(f"Ollama response: {result}\n")
-            return result
-        else:
-            error_msg = f"Ollama request failed: {response.status_code} - {response.text}"
-            with open(log_file, 'a') as log:
-                log.write(f"Error: {error_msg}\n")
-            raise Exception(error_msg)
+        response = _SESSION.post(url, json=data, timeout=60, stream=True)
     except requests.exceptions.RequestException as e:
         error_msg = f"Ollama connection error: {str(e)}"
-        with open(log_file, 'a') as log:
-            log.write(f"Error: {error_msg}\n")
+        log.write(f"Error: {error_msg}\n")
         raise Exception(error_msg)
+    
+    with response:
+        if response.status_code != 200:
+            error_msg = f"Ollama request failed: {response.status_code} - {response.text}"
+            log.write(f"Error: {error_msg}\n")
+            raise Exception(error_msg)
+        
+        # Write tokens to the log as they arrive rather than after the
+        # whole generation has been buffered
+        log.write("Ollama response: ")
+        parts = []
+        try:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                try:
+                    chunk = json_loads(line)
+                except ValueError as e:
+                    error_msg = f"Ollama sent an invalid response line: {str(e)}"
+                    log.write(f"\nError: {error_msg}\n")
+                    raise Exception(error_msg)
+                if 'error' in chunk:
+                    error_msg = f"Ollama generation failed: {chunk['error']}"
+                    log.write(f"\nError: {error_msg}\n")
+                    raise Exception(error_msg)
+                fragment = chunk.get('response', '')
+                parts.append(fragment)
+                log.write(fragment)
+                if chunk.get('done'):
+                    break
+        except requests.exceptions.RequestException as e:
+            error_msg = f"Ollama connection error: {str(e)}"
+            log.write(f"\nError: {error_msg}\n")
+            raise Exception(error_msg)
+        log.write("\n")
+    
+    return ''.join(parts)
 
 def append_execution_log(entry, path='executions.json'):
-    if not os.path.exists(path):
-        with open(path, 'w') as f:
-            json.dump([], f)
-    with open(path, 'r+') as f:
+    # Splice the entry in before the array's closing bracket instead of
+    # re-reading and rewriting the whole history; the file stays a single
+    # JSON array for the API routes that read it
+    record = textwrap.indent(json_dumps(entry, indent=True), '  ').encode()
+    try:
+        with open(path, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            tail_start = max(0, end - 256)
+            f.seek(tail_start)
+            tail = f.read()
+            close = tail.rfind(b']')
+            body = tail[:close].rstrip() if close != -1 else b''
+            if body.endswith(b'['):
+                separator = b'\n'
+            elif body.endswith(b'}'):
+                separator = b',\n'
+            else:
+                raise ValueError("executions log does not end with a JSON array")
+            f.seek(tail_start + len(body))
+            f.truncate()
+            f.write(separator + record + b'\n]')
+    except FileNotFoundError:
+        with open(path, 'wb') as f:
+            f.write(b'[\n' + record + b'\n]')
+    except ValueError:
+        _rewrite_execution_log(entry, path)
+
+def _rewrite_execution_log(entry, path):
+    # Slow path for a file the splice can't handle: parse, append, rewrite.
+    # Written with the same encoder as the splice so later appends match
+    with open(path, 'rb+') as f:
         try:
-            data = json.load(f)
-        except json.JSONDecodeError:
+            data = json_loads(f.read())
+        except ValueError:
             data = []
         data.append(entry)
         f.seek(0)
-        json.dump(data, f, indent=2)
+        f.write(json_dumps(data, indent=True).encode())
         f.truncate()
 
 def main():
@@ -215,12 +334,13 @@ def main():
             "current_directory": os.getcwd(),
             "directory_contents": os.listdir(".")
         }
-        write_debug_log(f"Initial debug info: {json.dumps(debug_info, indent=2)}")
-        print(f"DEBUG_INFO: {json.dumps(debug_info, indent=2)}")
+        debug_info_json = json_dumps(debug_info, indent=True)
+        debug_log.debug("Initial debug info: %s", debug_info_json)
+        print(f"DEBUG_INFO: {debug_info_json}")
 
         if len(sys.argv) != 3:
             error_msg = f"Incorrect number of arguments. Received: {sys.argv}"
-            write_debug_log(error_msg)
+            debug_log.error(error_msg)
             print(f"ERROR: {error_msg}")
             sys.exit(1)
 
@@ -233,110 +353,108 @@ def main():
             "input_arg_type": type(input_arg).__name__,
             "input_arg_stripped": input_arg_stripped
         }
-        write_debug_log(f"Input debug info: {json.dumps(input_debug, indent=2)}")
-        print(f"INPUT_DEBUG: {json.dumps(input_debug, indent=2)}")
+        input_debug_json = json_dumps(input_debug, indent=True)
+        debug_log.debug("Input debug info: %s", input_debug_json)
+        print(f"INPUT_DEBUG: {input_debug_json}")
 
         input_data = None
         # Attempt to load input from file if it exists and ends with .json
         if os.path.exists(input_arg_stripped) and input_arg_stripped.endswith('.json'):
-            write_debug_log(f"Attempting to load input from file: {input_arg_stripped}")
+            debug_log.debug("Attempting to load input from file: %s", input_arg_stripped)
             try:
                 with open(input_arg_stripped, 'r') as f:
-                    input_data = json.load(f)
-                    write_debug_log(f"Successfully loaded input data from file: {input_data}")
+                    input_data = json_loads(f.read())
+                    debug_log.debug("Successfully loaded input data from file: %s", input_data)
             except Exception as e:
-                write_debug_log(f"Error loading input file: {e}")
+                debug_log.error("Error loading input file: %s", e)
                 print(f"ERROR: Failed to load input file: {e}")
                 sys.exit(1)
         else:
             try:
-                input_data = json.loads(input_arg_stripped)
-                write_debug_log(f"Successfully parsed input data from JSON string: {input_data}")
+                input_data = json_loads(input_arg_stripped)
+                debug_log.debug("Successfully parsed input data from JSON string: %s", input_data)
             except json.JSONDecodeError as e:
-                write_debug_log(f"Error parsing input JSON: {e}")
+                debug_log.error("Error parsing input JSON: %s", e)
                 print(f"ERROR: Failed to parse input JSON: {e}")
                 sys.exit(1)
 
+        # Serialized once for the execution log
+        input_json = json_dumps(input_data)
+
         flow_name = os.path.basename(flow_path).replace(".json", "")
         execution_id = str(uuid4())
         start_time = datetime.now(timezone.utc)
         log_file = os.path.join(LOGS_DIR, f"{execution_id}.log")
 
-        try:
-            # Log start of execution
-            with open(log_file, 'a') as log:
+        # One handle for the whole execution; closing it flushes the log,
+        # including on the error path
+        with open(log_file, 'a', buffering=8192) as log:
+            try:
+                # Log start of execution
                 log.write(f"[START] Execution {execution_id} for flow '{flow_name}' at {start_time.isoformat()}\n")
-                log.write(f"Input: {json.dumps(input_data)}\n")
-            write_debug_log(f"[START] Execution {execution_id} for flow '{flow_name}' at {start_time.isoformat()}")
+                log.write(f"Input: {input_json}\n")
+                debug_log.debug("[START] Execution %s for flow '%s' at %s", execution_id, flow_name, start_time.isoformat())
 
-            # Load workflow
-            write_debug_log(f"Attempting to load workflow from path: {flow_path}")
-            with open(log_file, 'a') as log:
+                # Load workflow
+                debug_log.debug("Attempting to load workflow from path: %s", flow_path)
                 log.write(f"Loading workflow from: {flow_path}\n")
-            flow = load_workflow(flow_path)
-            with open(log_file, 'a') as log:
+                flow = load_workflow(flow_path)
                 log.write(f"Workflow loaded. Node count: {len(flow['nodes']) if 'nodes' in flow else 'N/A'}\n")
-            write_debug_log(f"Successfully loaded flow with {len(flow['nodes'])} nodes")
-            print(f"DEBUG: Successfully loaded flow with {len(flow['nodes'])} nodes")
+                debug_log.debug("Successfully loaded flow with %s nodes", len(flow['nodes']))
+                print(f"DEBUG: Successfully loaded flow with {len(flow['nodes'])} nodes")
 
-            # Extract prompt
-            with open(log_file, 'a') as log:
+                # Extract prompt
                 log.write(f"Extracting prompt from flow and input...\n")
-            prompt = extract_prompt(flow, input_data)
-            with open(log_file, 'a') as log:
+                prompt = extract_prompt(flow, input_data)
                 log.write(f"Prompt extracted: {prompt}\n")
 
-            # Run the flow (Ollama)
-            with open(log_file, 'a') as log:
+                # Run the flow (Ollama)
                 log.write(f"Calling Ollama with prompt...\n")
-            output = run_ollama(prompt, log_file)
-            with open(log_file, 'a') as log:
+                output = run_ollama(prompt, log)
                 log.write(f"Ollama output: {output}\n")
 
-            # Calculate duration
-            end_time = datetime.now(timezone.utc)
-            duration = (end_time - start_time).total_seconds()
-            with open(log_file, 'a') as log:
+                # Calculate duration
+                end_time = datetime.now(timezone.utc)
+                duration = (end_time - start_time).total_seconds()
                 log.write(f"[END] Execution completed in {duration:.2f} seconds.\n")
-            write_debug_log(f"[END] Execution {execution_id} completed in {duration:.2f} seconds.")
-
-            # Create execution log entry
-            execution_log = {
-                "id": execution_id,
-                "flow": flow_name,
-                "status": "Success",
-                "input": input_data,
-                "output": output,
-                "error": "",
-                "startTime": start_time.isoformat(),
-                "duration": duration
-            }
-            append_execution_log(execution_log)
-            print(json.dumps(execution_log))
-        except Exception as e:
-            end_time = datetime.now(timezone.utc)
-            duration = (end_time - start_time).total_seconds()
-            error_log = {
-                "id": execution_id,
-                "flow": flow_name,
-                "status": "Error",
-                "input": input_data,
-                "output": "",
-                "error": str(e),
-                "startTime": start_time.isoformat(),
-                "duration": duration
-            }
-            with open(log_file, 'a') as log:
+                debug_log.debug("[END] Execution %s completed in %.2f seconds.", execution_id, duration)
+
+                # Create execution log entry
+                execution_log = {
+                    "id": execution_id,
+                    "flow": flow_name,
+                    "status": "Success",
+                    "input": input_data,
+                    "output": output,
+                    "error": "",
+                    "startTime": start_time.isoformat(),
+                    "duration": duration
+                }
+                append_execution_log(execution_log)
+                print(json_dumps(execution_log))
+            except Exception as e:
+                end_time = datetime.now(timezone.utc)
+                duration = (end_time - start_time).total_seconds()
+                error_log = {
+                    "id": execution_id,
+                    "flow": flow_name,
+                    "status": "Error",
+                    "input": input_data,
+                    "output": "",
+                    "error": str(e),
+                    "startTime": start_time.isoformat(),
+                    "duration": duration
+                }
                 log.write(f"[ERROR] {str(e)}\n")
                 log.write(f"[END] Execution failed after {duration:.2f} seconds.\n")
-            write_debug_log(f"Error during flow execution: {str(e)}")
-            print(f"ERROR: {str(e)}")
-            append_execution_log(error_log)
-            print(json.dumps(error_log))
-            sys.exit(1)
+                debug_log.error("Error during flow execution: %s", e)
+                print(f"ERROR: {str(e)}")
+                append_execution_log(error_log)
+                print(json_dumps(error_log))
+                sys.exit(1)
     except Exception as e:
         error_msg = f"Unexpected error in main: {str(e)}"
-        write_debug_log(error_msg)
+        debug_log.error(error_msg)
         print(f"ERROR: {error_msg}")
         sys.exit(1)
 